@@ -0,0 +1,91 @@
+# benchmarks/bench_processing.py
+#
+# Compare the processing engines on synthetic data:
+#
+#   $ python -m benchmarks.bench_processing --athletes 50 --activities 20000
+
+import argparse
+import json
+import random
+import timeit
+
+from data_processing import process_ranking, process_activities, process_best_efforts
+
+SEGMENTS = [('400m', 400), ('1K', 1000), ('1 mile', 1609), ('5K', 5000), ('10K', 10000)]
+PROCESSORS = [process_ranking, process_activities, process_best_efforts]
+ENGINES = ['pandas', 'arrow']
+
+def generate_data(n_athletes, n_activities, seed=0):
+    """
+    Generate athlete and activity items in the format returned by DynamoDB.
+
+    Parameters:
+    n_athletes (int): The number of athletes.
+    n_activities (int): The number of activities.
+    seed (int): The seed of the random generator.
+
+    Returns:
+    tuple: A list of athlete items and a list of activity items.
+    """
+    rng = random.Random(seed)
+
+    athlete_data = [
+        {
+            'athlete_id': athlete_id,
+            'data': json.dumps({
+                'firstname': f'Atleet{athlete_id}',
+                'lastname': 'Loper',
+                'profile': f'https://example.com/{athlete_id}/large.jpg',
+            }),
+        }
+        for athlete_id in range(1, n_athletes + 1)
+    ]
+
+    activity_data = []
+    for _ in range(n_activities):
+        distance = rng.uniform(3000, 21000)
+        elapsed_time = int(distance / 1000 * rng.uniform(240, 420))
+        best_efforts = [
+            {
+                'name': name,
+                'distance': segment,
+                'elapsed_time': int(segment / 1000 * rng.uniform(200, 400)),
+                'start_date_local': '2024-11-01T08:00:00Z',
+            }
+            for name, segment in SEGMENTS if segment <= distance
+        ]
+        activity_data.append({
+            'data': json.dumps({
+                'athlete': {'id': rng.randint(1, n_athletes)},
+                'type': rng.choice(['Run', 'Run', 'Run', 'Ride']),
+                'name': 'Ochtendloop',
+                'distance': distance,
+                'elapsed_time': elapsed_time,
+                'start_date_local': f'2024-{rng.randint(10, 12)}-{rng.randint(10, 28)}T{rng.randint(10, 20)}:00:00Z',
+                'best_efforts': best_efforts,
+            }),
+        })
+
+    return athlete_data, activity_data
+
+def main():
+    parser = argparse.ArgumentParser(description='Compare the processing engines on synthetic data.')
+    parser.add_argument('--athletes', type=int, default=50)
+    parser.add_argument('--activities', type=int, default=5000)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    athlete_data, activity_data = generate_data(args.athletes, args.activities)
+
+    print(f"{args.athletes} athletes, {args.activities} activities, best of {args.repeat} runs")
+    for processor in PROCESSORS:
+        for engine in ENGINES:
+            seconds = min(timeit.repeat(
+                lambda: processor(athlete_data, activity_data, [], engine=engine),
+                number=1,
+                repeat=args.repeat,
+            ))
+            print(f"{processor.__name__:<22} {engine:<8} {seconds * 1000:8.1f} ms")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+# benchmarks/bench_startup.py
+#
+# Measure the import time of the app in fresh interpreters, the work done on a
+# cold start before the first page can be rendered:
+#
+#   $ python -m benchmarks.bench_startup --module streamlit_app --repeat 10
+
+import argparse
+import statistics
+import subprocess
+import sys
+
+def import_times(module):
+    """
+    Import a module in a fresh interpreter with -X importtime.
+
+    Parameters:
+    module (str): The name of the module to import.
+
+    Returns:
+    tuple: The cumulative import time of the module and a dictionary with the time
+           spent in each top-level package, both in microseconds.
+    """
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+        capture_output=True, text=True, check=True,
+    )
+
+    total = 0
+    packages = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+
+        self_time, cumulative, name = line[len('import time:'):].split('|')
+        name = name.strip()
+        if name == module:
+            total = int(cumulative)
+
+        # Attribute the time spent in each module itself to its top-level package
+        package = name.split('.')[0]
+        packages[package] = packages.get(package, 0) + int(self_time)
+
+    return total, packages
+
+def main():
+    parser = argparse.ArgumentParser(description='Measure the import time of the app.')
+    parser.add_argument('--module', default='streamlit_app')
+    parser.add_argument('--repeat', type=int, default=10)
+    parser.add_argument('--top', type=int, default=10)
+    args = parser.parse_args()
+
+    totals, runs = zip(*(import_times(args.module) for _ in range(args.repeat)))
+
+    print(f"import {args.module}: median {statistics.median(totals) / 1000:.1f} ms, "
+          f"min {min(totals) / 1000:.1f} ms over {args.repeat} runs")
+
+    medians = {
+        name: statistics.median(run.get(name, 0) for run in runs)
+        for name in set().union(*runs)
+    }
+    for name, median in sorted(medians.items(), key=lambda item: item[1], reverse=True)[:args.top]:
+        print(f"  {name:<24} {median / 1000:8.1f} ms")
+
+if __name__ == "__main__":
+    main()
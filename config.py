@@ -5,4 +5,6 @@ START_YEAR = 2024  # Start year of the challenge
 START_WEEK = 42 # Start week of the challenge
 TOTAL_WEEKS = 26 # Total # of weeks of the challenge
 TOTAL_KMS = 6000 # Goal of total kms
-EXCLUDE_IDS = [134986513, 114937900] # Athletes to exclude
\ No newline at end of file
+EXCLUDE_IDS = [134986513, 114937900] # Athletes to exclude
+ENGINE = 'pandas' # Processing engine: 'pandas' or 'arrow'
+CACHE_TTL = 600 # Seconds before the data is reloaded from DynamoDB
\ No newline at end of file
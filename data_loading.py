@@ -0,0 +1,93 @@
+# data_loading.py
+
+import streamlit as st
+
+from config import START_YEAR, START_WEEK, TOTAL_WEEKS, EXCLUDE_IDS, ENGINE, CACHE_TTL
+from utils import get_dynamodb_resource, get_all_dynamodb_items, get_profile_thumbnails
+from data_processing import process_ranking, process_activities, process_best_efforts
+from data_processing import process_weekly_progress, process_athlete_progress
+from data_processing.tables import map_values, to_pandas
+
+REGION_NAME = 'eu-central-1'
+
+@st.cache_resource
+def get_dynamodb():
+    """
+    Create the DynamoDB resource once per server process.
+
+    Returns:
+    boto3.resources.factory.dynamodb.ServiceResource: The DynamoDB resource.
+    """
+    return get_dynamodb_resource(
+        aws_access_key_id=st.secrets["aws_access_key_id"],
+        aws_secret_access_key=st.secrets["aws_secret_access_key"],
+        region_name=REGION_NAME
+    )
+
+@st.cache_data(ttl=CACHE_TTL, show_spinner=False)
+def load_data():
+    """
+    Retrieve the athletes and activities from DynamoDB, cached for CACHE_TTL seconds.
+
+    Returns:
+    tuple: A list of athlete items and a list of activity items.
+    """
+    dynamodb = get_dynamodb()
+
+    athlete_data = get_all_dynamodb_items(dynamodb.Table('athlete_credentials'))
+    activity_data = get_all_dynamodb_items(dynamodb.Table('activities'))
+
+    return athlete_data, activity_data
+
+@st.cache_data(ttl=CACHE_TTL, show_spinner=False)
+def build_tables(engine=ENGINE):
+    """
+    Process the data into the ranking, activities and best efforts tables, cached for
+    CACHE_TTL seconds. Profile pictures are replaced by their local thumbnails.
+
+    Parameters:
+    engine (str): The processing engine, 'pandas' or 'arrow'.
+
+    Returns:
+    tuple: The ranking, activities and best efforts tables.
+    """
+    athlete_data, activity_data = load_data()
+
+    ranking_df = process_ranking(athlete_data, activity_data, EXCLUDE_IDS, engine=engine)
+    activity_df = process_activities(athlete_data, activity_data, EXCLUDE_IDS, engine=engine)
+    best_efforts_df = process_best_efforts(athlete_data, activity_data, EXCLUDE_IDS, engine=engine)
+
+    # Serve small, locally cached profile pictures instead of the remote originals
+    thumbnails = get_profile_thumbnails(athlete_data, inline=not st.get_option('server.enableStaticServing'))
+    ranking_df = map_values(ranking_df, 'Profile_pic', thumbnails)
+    activity_df = map_values(activity_df, 'Profile_pic', thumbnails)
+    best_efforts_df = map_values(best_efforts_df, 'Profile_pic', thumbnails)
+
+    return ranking_df, activity_df, best_efforts_df
+
+@st.cache_data(ttl=CACHE_TTL, show_spinner=False)
+def build_progress(engine=ENGINE):
+    """
+    Aggregate the activities into the weekly progress of the club and of each athlete,
+    cached for CACHE_TTL seconds.
+
+    Parameters:
+    engine (str): The processing engine, 'pandas' or 'arrow'.
+
+    Returns:
+    tuple: The weekly progress and the weekly progress per athlete.
+    """
+    _, activity_df, _ = build_tables(engine)
+    progress_df = to_pandas(activity_df, ['Atleet', 'Datum', 'KM'])
+
+    weekly_km = process_weekly_progress(progress_df, START_YEAR, START_WEEK, TOTAL_WEEKS)
+    athlete_progress = process_athlete_progress(progress_df, START_YEAR, START_WEEK, TOTAL_WEEKS)
+
+    return weekly_km, athlete_progress
+
+def warm_up():
+    """
+    Load the data and build the tables, so the first viewer is served from the cache.
+    """
+    build_tables(ENGINE)
+    build_progress(ENGINE)
@@ -3,5 +3,7 @@
 from .ranking import process_ranking
 from .activities import process_activities
 from .best_efforts import process_best_efforts
+from .progress import process_weekly_progress, process_athlete_progress
 
-__all__ = ['process_ranking', 'process_activities', 'process_best_efforts']
+__all__ = ['process_ranking', 'process_activities', 'process_best_efforts',
+           'process_weekly_progress', 'process_athlete_progress']
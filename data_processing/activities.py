@@ -4,6 +4,7 @@ import json
 import pandas as pd
 
 from utils.name_utils import process_names
+from .arrow_engine import process_activities_arrow
 
 # Constants for keys
 ATHLETE_ID = 'athlete_id'
@@ -62,7 +63,7 @@ def format_time(seconds):
     else:
         return f"{minutes}m {remaining_seconds}s"  # Minutes format
 
-def process_activities(athlete_data, activity_data, EXCLUDE_IDS):
+def process_activities(athlete_data, activity_data, EXCLUDE_IDS, engine='pandas'):
     """
     Process athlete and activity data to calculate total kilometers, number of activities,
     and the date of the last activity for each athlete.
@@ -74,13 +75,19 @@ def process_activities(athlete_data, activity_data, EXCLUDE_IDS):
     activity_data (list of dict): A list of dictionaries containing activity information.
                                    Each dictionary should include 'data' with details like 
                                    distance, start date, and athlete ID.
+    engine (str): The processing engine, 'pandas' or 'arrow'.
 
     Returns:
     pd.DataFrame: A DataFrame containing the processed activity data for athletes, 
                   including profile picture, athlete name, activity name, date, 
                   distance in kilometers, and elapsed time.
+                  With the 'arrow' engine a pa.Table with the same columns is returned.
     """
-    
+    if engine == 'arrow':
+        return process_activities_arrow(athlete_data, activity_data, EXCLUDE_IDS)
+    elif engine != 'pandas':
+        raise ValueError(f"Unknown engine: {engine}")
+
     # Extract athlete information into a dictionary
     athlete_names = process_names(athlete_data)
 
@@ -119,7 +126,7 @@ def process_activities(athlete_data, activity_data, EXCLUDE_IDS):
     df = pd.DataFrame(activities)
 
     # Sort by 'Datum' in descending order
-    df = df.sort_values(by='Datum', ascending=False)
+    df = df.sort_values(by='Datum', ascending=False, kind='stable')
 
     # Convert distance from meters to kilometers and round
     df['KM'] = df['KM'].apply(lambda x: round(x / 1000, 1) if x is not None else 0)
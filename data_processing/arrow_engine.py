@@ -0,0 +1,239 @@
+# data_processing/arrow_engine.py
+
+import json
+
+import pyarrow as pa
+import pyarrow.compute as pc
+
+from utils.name_utils import process_names
+
+# Constants for keys
+ATHLETE_ID = 'athlete_id'
+ATHLETE_DATA = 'data'
+PROFILE_PIC = 'profile'
+DISTANCE = 'distance'
+ELAPSED_TIME = 'elapsed_time'
+START_DATE = 'start_date_local'
+ACTIVITY_TYPE = 'type'
+RUN_TYPE = 'Run'
+BEST_EFFORTS = 'best_efforts'
+LAST_ACTIVITY = 'Laatste activiteit'
+ROW_NUMBER = '__row'
+ATHLETE_ORDER = '__athlete_order'
+
+def _athlete_table(athlete_data, EXCLUDE_IDS):
+    """
+    Build a table with the id, profile picture and name of each athlete.
+    """
+    athlete_names = process_names(athlete_data)
+
+    ids, profile_pics, names = [], [], []
+    for athlete in athlete_data:
+        athlete_id = athlete.get(ATHLETE_ID)
+        if athlete_id in EXCLUDE_IDS:
+            continue
+
+        ids.append(int(athlete_id))
+        profile_pics.append(json.loads(athlete.get(ATHLETE_DATA)).get(PROFILE_PIC))
+        names.append(athlete_names.get(athlete_id))
+
+    return pa.table({
+        ATHLETE_ID: pa.array(ids, pa.int64()),
+        'Profile_pic': pa.array(profile_pics, pa.string()),
+        'Atleet': pa.array(names, pa.string()),
+        ATHLETE_ORDER: pa.array(range(len(ids)), pa.int64()),
+    })
+
+def _activity_table(activity_data):
+    """
+    Build a table with one row per activity from the raw activity JSON.
+    """
+    ids, types, names, distances, elapsed_times, start_dates = [], [], [], [], [], []
+    for activity in activity_data:
+        data = json.loads(activity[ATHLETE_DATA])
+
+        ids.append(data.get('athlete', {}).get('id'))
+        types.append(data.get(ACTIVITY_TYPE))
+        names.append(data.get('name'))
+        distances.append(data.get(DISTANCE))
+        elapsed_times.append(data.get(ELAPSED_TIME))
+        start_dates.append(data.get(START_DATE))
+
+    return pa.table({
+        ATHLETE_ID: pa.array(ids, pa.int64()),
+        ACTIVITY_TYPE: pa.array(types, pa.string()),
+        'Activiteit': pa.array(names, pa.string()),
+        DISTANCE: pa.array(distances, pa.float64()),
+        ELAPSED_TIME: pa.array(elapsed_times, pa.int64()),
+        START_DATE: pa.array(start_dates, pa.string()),
+        ROW_NUMBER: pa.array(range(len(ids)), pa.int64()),
+    })
+
+def _best_effort_table(activity_data):
+    """
+    Build a table with one row per best effort from the raw activity JSON.
+    """
+    ids, segments, distances, elapsed_times, start_dates, names = [], [], [], [], [], []
+    for activity in activity_data:
+        data = json.loads(activity[ATHLETE_DATA])
+
+        # Check if 'best_efforts' exists and is not empty
+        if not data.get(BEST_EFFORTS):
+            continue
+
+        athlete_id = data.get('athlete', {}).get('id')
+        for effort in data[BEST_EFFORTS]:
+            ids.append(athlete_id)
+            segments.append(effort.get('name'))
+            distances.append(effort.get(DISTANCE))
+            elapsed_times.append(effort.get(ELAPSED_TIME))
+            start_dates.append(effort.get(START_DATE))
+            names.append(data.get('name'))
+
+    return pa.table({
+        ATHLETE_ID: pa.array(ids, pa.int64()),
+        'Segment': pa.array(segments, pa.string()),
+        DISTANCE: pa.array(distances, pa.float64()),
+        ELAPSED_TIME: pa.array(elapsed_times, pa.int64()),
+        START_DATE: pa.array(start_dates, pa.string()),
+        'Activiteit': pa.array(names, pa.string()),
+    })
+
+def _round_km(distance_meters):
+    """
+    Convert meters to kilometers rounded to 1 decimal with Python's round(), like the
+    pandas engine. pc.round rounds the decimal value half to even, which gives
+    different results, e.g. 1050 m becomes 1.0 instead of 1.1 km.
+    """
+    distances = pc.fill_null(distance_meters, 0.0).to_pylist()
+
+    return pa.array([round(distance / 1000, 1) for distance in distances], pa.float64())
+
+def _to_string(values):
+    return pc.cast(pc.cast(values, pa.int64()), pa.string())
+
+def _pace(distance_meters, time_seconds):
+    """
+    Vectorized version of pace_from_distance_time, formatted as 'min:sec /km'.
+    """
+    pace_min = pc.divide(pc.divide(pc.cast(time_seconds, pa.float64()), 60), pc.divide(distance_meters, 1000))
+    minutes = pc.floor(pace_min)
+    seconds = pc.floor(pc.multiply(pc.subtract(pace_min, minutes), 60))
+
+    return pc.binary_join_element_wise(
+        _to_string(minutes), ':', pc.utf8_lpad(_to_string(seconds), width=2, padding='0'), ' /km', ''
+    )
+
+def _format_time(seconds):
+    """
+    Vectorized version of format_time, formatted as hours and minutes or minutes and seconds.
+    """
+    seconds = pc.cast(seconds, pa.int64())
+    hours = pc.divide(seconds, 3600)
+    minutes = pc.divide(pc.subtract(seconds, pc.multiply(hours, 3600)), 60)
+    remaining_seconds = pc.subtract(seconds, pc.add(pc.multiply(hours, 3600), pc.multiply(minutes, 60)))
+
+    formatted = pc.if_else(
+        pc.greater(hours, 0),
+        pc.binary_join_element_wise(_to_string(hours), 'u ', _to_string(minutes), 'm', ''),
+        pc.binary_join_element_wise(_to_string(minutes), 'm ', _to_string(remaining_seconds), 's', ''),
+    )
+
+    return pc.if_else(pc.less(seconds, 0), 'Invalid time', formatted)
+
+def _number_rows(table):
+    """
+    Insert a row number column, starting from 1, as the first column.
+    """
+    return table.add_column(0, '', pa.array(range(1, table.num_rows + 1), pa.int64()))
+
+def process_ranking_arrow(athlete_data, activity_data, EXCLUDE_IDS):
+    """
+    Arrow version of process_ranking.
+
+    Returns:
+    pa.Table: A table with the same columns as the DataFrame returned by process_ranking.
+    """
+    athletes = _athlete_table(athlete_data, EXCLUDE_IDS)
+    activities = _activity_table(activity_data)
+
+    runs = activities.filter(pc.equal(activities[ACTIVITY_TYPE], RUN_TYPE))
+    runs = runs.append_column(
+        LAST_ACTIVITY, pc.strptime(runs[START_DATE], format='%Y-%m-%dT%H:%M:%SZ', unit='s')
+    )
+
+    totals = runs.group_by(ATHLETE_ID).aggregate([
+        (DISTANCE, 'sum'),
+        (DISTANCE, 'count'),
+        (LAST_ACTIVITY, 'max'),
+    ])
+
+    # Keep athletes without activities, ties stay in the order of athlete_data
+    ranking = athletes.join(totals, ATHLETE_ID, join_type='left outer')
+    ranking = ranking.sort_by([(f'{DISTANCE}_sum', 'descending'), (ATHLETE_ORDER, 'ascending')])
+
+    ranking = pa.table({
+        'Profile_pic': ranking['Profile_pic'],
+        'Atleet': ranking['Atleet'],
+        'KM': _round_km(ranking[f'{DISTANCE}_sum']),
+        'Act.': pc.fill_null(ranking[f'{DISTANCE}_count'], 0),
+        LAST_ACTIVITY: ranking[f'{LAST_ACTIVITY}_max'],
+    })
+
+    return _number_rows(ranking)
+
+def process_activities_arrow(athlete_data, activity_data, EXCLUDE_IDS):
+    """
+    Arrow version of process_activities.
+
+    Returns:
+    pa.Table: A table with the same columns as the DataFrame returned by process_activities.
+    """
+    athletes = _athlete_table(athlete_data, EXCLUDE_IDS)
+    activities = _activity_table(activity_data)
+
+    runs = activities.filter(pc.equal(activities[ACTIVITY_TYPE], RUN_TYPE))
+    # Ties stay in the order of activity_data
+    runs = runs.join(athletes, ATHLETE_ID, join_type='inner')
+    runs = runs.sort_by([(START_DATE, 'descending'), (ROW_NUMBER, 'ascending')])
+
+    return pa.table({
+        'Profile_pic': runs['Profile_pic'],
+        'Atleet': runs['Atleet'],
+        'KM': _round_km(runs[DISTANCE]),
+        'Tempo': _pace(runs[DISTANCE], runs[ELAPSED_TIME]),
+        'Tijd': _format_time(runs[ELAPSED_TIME]),
+        'Datum': runs[START_DATE],
+        'Activiteit': runs['Activiteit'],
+    })
+
+def process_best_efforts_arrow(athlete_data, activity_data, EXCLUDE_IDS):
+    """
+    Arrow version of process_best_efforts.
+
+    Returns:
+    pa.Table: A table with the same columns as the DataFrame returned by process_best_efforts.
+    """
+    athletes = _athlete_table(athlete_data, EXCLUDE_IDS)
+    efforts = _best_effort_table(activity_data)
+
+    efforts = efforts.join(athletes, ATHLETE_ID, join_type='inner')
+    efforts = efforts.sort_by([(ELAPSED_TIME, 'ascending')])
+    efforts = efforts.append_column(ROW_NUMBER, pa.array(range(efforts.num_rows), pa.int64()))
+
+    # The first row of each group in the sorted table is its fastest effort
+    fastest = efforts.group_by(['Atleet', 'Segment']).aggregate([(ROW_NUMBER, 'min')])
+    first_rows = fastest[f'{ROW_NUMBER}_min']
+    efforts = efforts.take(pc.take(first_rows, pc.sort_indices(first_rows)))
+
+    return pa.table({
+        'Profile_pic': efforts['Profile_pic'],
+        'Atleet': efforts['Atleet'],
+        'Segment': efforts['Segment'],
+        'Distance_km': pc.divide(efforts[DISTANCE], 1000),
+        'Tijd': _format_time(efforts[ELAPSED_TIME]),
+        'Sort_Time': efforts[ELAPSED_TIME],
+        'Tempo': _pace(efforts[DISTANCE], efforts[ELAPSED_TIME]),
+        'Datum': efforts[START_DATE],
+        'Activiteit': efforts['Activiteit'],
+    })
@@ -5,6 +5,7 @@ import pandas as pd
 import datetime
 
 from utils.name_utils import process_names
+from .arrow_engine import process_best_efforts_arrow
 
 # Constants for keys
 ATHLETE_ID = 'athlete_id'
@@ -64,7 +65,7 @@ def format_time(seconds):
     else:
         return f"{minutes}m {remaining_seconds}s"  # Minutes format
 
-def process_best_efforts(athlete_data, activity_data, EXCLUDE_IDS):
+def process_best_efforts(athlete_data, activity_data, EXCLUDE_IDS, engine='pandas'):
     """
     Process athlete and activity data to calculate best efforts for each athlete
     from the 'best_efforts' field in the activity data and return only the fastest segment
@@ -77,13 +78,19 @@ def process_best_efforts(athlete_data, activity_data, EXCLUDE_IDS):
     activity_data (list of dict): A list of dictionaries containing activity information.
                                    Each dictionary should include 'data' with details like 
                                    distance, start date, best efforts, and athlete ID.
+    engine (str): The processing engine, 'pandas' or 'arrow'.
 
     Returns:
     pd.DataFrame: A DataFrame containing the fastest segment per athlete for each segment, 
                   including profile picture, athlete name, segment name, distance, 
                   elapsed time, and pace.
+                  With the 'arrow' engine a pa.Table with the same columns is returned.
     """
-    
+    if engine == 'arrow':
+        return process_best_efforts_arrow(athlete_data, activity_data, EXCLUDE_IDS)
+    elif engine != 'pandas':
+        raise ValueError(f"Unknown engine: {engine}")
+
     # Extract athlete information into a dictionary
     athlete_names = process_names(athlete_data)
 
@@ -0,0 +1,103 @@
+# data_processing/progress.py
+
+import pandas as pd
+
+# Constants for column names
+ATHLETE = 'Atleet'
+DISTANCE_KM = 'KM'
+DATE = 'Datum'
+WEEKS_SINCE_START = 'Weeks_Since_Start'
+CUMULATIVE_KM = 'Cumulative_KM'
+
+def weeks_since_start(dates, START_YEAR, START_WEEK):
+    """
+    Calculate the challenge week of each date, vectorized over a Series.
+
+    Parameters:
+    dates (pd.Series): A Series of dates (strings or datetimes).
+    START_YEAR (int): The starting year of the challenge.
+    START_WEEK (int): The starting week of the challenge (ISO week number).
+
+    Returns:
+    pd.Series: The number of weeks since the start of the challenge for each date,
+               starting from 0. Dates before START_YEAR are returned as NA.
+    """
+    iso = pd.to_datetime(dates).dt.isocalendar().astype('Int64')
+    weeks = (iso['year'] - START_YEAR) * 52 + (iso['week'] - START_WEEK)
+
+    return weeks.where(iso['year'] >= START_YEAR)
+
+def process_weekly_progress(activity_df, START_YEAR, START_WEEK, TOTAL_WEEKS):
+    """
+    Aggregate activities into weekly and cumulative kilometers for the whole club.
+
+    The input DataFrame is not modified.
+
+    Parameters:
+    activity_df (pd.DataFrame): A DataFrame as returned by process_activities,
+                                with at least the 'Datum' and 'KM' columns.
+    START_YEAR (int): The starting year of the challenge.
+    START_WEEK (int): The starting week of the challenge.
+    TOTAL_WEEKS (int): The total number of weeks in the challenge.
+
+    Returns:
+    pd.DataFrame: One row per challenge week (0 up to and including TOTAL_WEEKS) with
+                  the columns 'Weeks_Since_Start', 'KM' and 'Cumulative_KM'.
+    """
+    weeks = weeks_since_start(activity_df[DATE], START_YEAR, START_WEEK)
+
+    # Group by week and sum distances, including every week of the challenge
+    weekly_km = (
+        activity_df[DISTANCE_KM]
+        .groupby(weeks.rename(WEEKS_SINCE_START))
+        .sum()
+        .reindex(range(0, TOTAL_WEEKS + 1), fill_value=0)
+        .rename_axis(WEEKS_SINCE_START)
+        .reset_index()
+    )
+
+    weekly_km[CUMULATIVE_KM] = weekly_km[DISTANCE_KM].cumsum()
+
+    return weekly_km
+
+def process_athlete_progress(activity_df, START_YEAR, START_WEEK, TOTAL_WEEKS):
+    """
+    Aggregate activities into weekly and cumulative kilometers per athlete.
+
+    The input DataFrame is not modified.
+
+    Parameters:
+    activity_df (pd.DataFrame): A DataFrame as returned by process_activities,
+                                with at least the 'Atleet', 'Datum' and 'KM' columns.
+    START_YEAR (int): The starting year of the challenge.
+    START_WEEK (int): The starting week of the challenge.
+    TOTAL_WEEKS (int): The total number of weeks in the challenge.
+
+    Returns:
+    pd.DataFrame: One row per athlete per challenge week with the columns 'Atleet',
+                  'Weeks_Since_Start', 'KM' and 'Cumulative_KM'. Athletes are ordered
+                  by their total kilometers in descending order.
+    """
+    weeks = weeks_since_start(activity_df[DATE], START_YEAR, START_WEEK)
+
+    # Athletes as rows, challenge weeks as columns
+    weekly_km = (
+        activity_df[DISTANCE_KM]
+        .groupby([activity_df[ATHLETE], weeks.rename(WEEKS_SINCE_START)])
+        .sum()
+        .unstack(fill_value=0)
+        .reindex(columns=range(0, TOTAL_WEEKS + 1), fill_value=0)
+    )
+
+    cumulative_km = weekly_km.cumsum(axis=1)
+
+    # Order athletes by their total distance
+    order = cumulative_km[TOTAL_WEEKS].sort_values(ascending=False, kind='stable').index
+
+    athlete_progress = pd.DataFrame({
+        DISTANCE_KM: weekly_km.loc[order].stack(),
+        CUMULATIVE_KM: cumulative_km.loc[order].stack(),
+    }).reset_index()
+    athlete_progress.columns = [ATHLETE, WEEKS_SINCE_START, DISTANCE_KM, CUMULATIVE_KM]
+
+    return athlete_progress
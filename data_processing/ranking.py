@@ -5,6 +5,7 @@ import pandas as pd
 import datetime
 
 from utils.name_utils import process_names
+from .arrow_engine import process_ranking_arrow
 
 # Constants for keys
 ATHLETE_ID = 'athlete_id'
@@ -19,7 +20,7 @@ RUN_TYPE = 'Run'
 LAST_ACTIVITY = 'Laatste activiteit'
 DEFAULT_LAST_ACTIVITY = None
 
-def process_ranking(athlete_data, activity_data, EXCLUDE_IDS):
+def process_ranking(athlete_data, activity_data, EXCLUDE_IDS, engine='pandas'):
     """
     Process athlete and activity data to calculate total kilometers, number of activities,
     and the date of the last activity for each athlete.
@@ -31,10 +32,17 @@ def process_ranking(athlete_data, activity_data, EXCLUDE_IDS):
     activity_data (list of dict): A list of dictionaries, where each dictionary contains 
                                    activity information, including 'data' (with details like 
                                    distance, start date, and athlete id).
+    engine (str): The processing engine, 'pandas' or 'arrow'.
 
     Returns:
     pd.DataFrame: A DataFrame containing the processed ranking data for athletes.
+                  With the 'arrow' engine a pa.Table with the same columns is returned.
     """
+    if engine == 'arrow':
+        return process_ranking_arrow(athlete_data, activity_data, EXCLUDE_IDS)
+    elif engine != 'pandas':
+        raise ValueError(f"Unknown engine: {engine}")
+
     athlete_names = process_names(athlete_data)
     
     athletes = {
@@ -71,7 +79,7 @@ def process_ranking(athlete_data, activity_data, EXCLUDE_IDS):
     df = pd.DataFrame(athletes.values())
 
     # Sort by 'Kilometers' in descending order
-    df = df.sort_values(by='Kilometers', ascending=False)
+    df = df.sort_values(by='Kilometers', ascending=False, kind='stable')
 
     # Round Kilometers values and rename the column to 'KM'
     df['Kilometers'] = [round(val / 1000, 1) for val in df['Kilometers']]
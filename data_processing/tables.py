@@ -0,0 +1,72 @@
+# data_processing/tables.py
+#
+# Helpers used by the display layer that work on both the pandas DataFrames
+# and the Arrow tables returned by the processing engines.
+
+import pyarrow as pa
+import pyarrow.compute as pc
+
+def column_sum(df, column):
+    """
+    Return the sum of a column.
+    """
+    if isinstance(df, pa.Table):
+        return pc.sum(df[column]).as_py() or 0
+
+    return df[column].sum()
+
+def unique_values(df, column):
+    """
+    Return the unique values of a column as a list, in order of appearance.
+    """
+    if isinstance(df, pa.Table):
+        return pc.unique(df[column]).to_pylist()
+
+    return list(df[column].unique())
+
+def map_values(df, column, mapping):
+    """
+    Replace the values of a column that are in mapping, leaving other values as is.
+    """
+    if isinstance(df, pa.Table):
+        values = df[column]
+        keys = pa.array(list(mapping.keys()), values.type)
+        mapped = pc.take(pa.array(list(mapping.values()), values.type), pc.index_in(values, value_set=keys))
+        return df.set_column(df.column_names.index(column), column, pc.coalesce(mapped, values))
+
+    df = df.copy()
+    df[column] = df[column].map(lambda value: mapping.get(value, value))
+    return df
+
+def filter_equal(df, column, value):
+    """
+    Return the rows where column equals value.
+    """
+    if isinstance(df, pa.Table):
+        return df.filter(pc.equal(df[column], value))
+
+    return df[df[column] == value]
+
+def select_columns(df, columns, rename=None):
+    """
+    Select and optionally rename columns, numbered from 1 in a leading '' column.
+    """
+    rename = rename or {}
+
+    if isinstance(df, pa.Table):
+        df = df.select(columns).rename_columns([rename.get(column, column) for column in columns])
+        return df.add_column(0, '', pa.array(range(1, df.num_rows + 1), pa.int64()))
+
+    df = df[columns].rename(columns=rename)
+    df.reset_index(drop=True, inplace=True)
+    df.insert(0, '', df.index + 1)
+    return df
+
+def to_pandas(df, columns):
+    """
+    Return the given columns as a pandas DataFrame.
+    """
+    if isinstance(df, pa.Table):
+        return df.select(columns).to_pandas()
+
+    return df[columns]
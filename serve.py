@@ -0,0 +1,32 @@
+# serve.py
+#
+# Start the app and warm up the data cache as soon as the server is running,
+# before the first viewer arrives. Takes the same options as `streamlit run`:
+#
+#   $ python serve.py --server.port 8501
+
+import sys
+import threading
+import time
+
+from streamlit.runtime import Runtime
+from streamlit.web import cli as stcli
+
+def _warm_up_when_started():
+    # Wait for the server runtime, so the caches are created in its cache storage
+    while not Runtime.exists():
+        time.sleep(0.1)
+
+    # Imported only now, so its caches are not created before the runtime exists
+    from data_loading import warm_up
+
+    try:
+        warm_up()
+    except Exception as e:
+        print(f"Failed to warm up the data cache: {e}")
+
+if __name__ == "__main__":
+    threading.Thread(target=_warm_up_when_started, daemon=True).start()
+
+    sys.argv = ['streamlit', 'run', 'streamlit_app.py', *sys.argv[1:]]
+    sys.exit(stcli.main())
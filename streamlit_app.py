@@ -1,49 +1,22 @@
-# Import standard libraries
-import datetime
-import json
-
 # Import third-party libraries
-import boto3
-from botocore.exceptions import ClientError
 import pandas as pd
 import streamlit as st
-import altair as alt
 
 # Import local configuration
-from config import START_YEAR, START_WEEK, TOTAL_WEEKS, TOTAL_KMS, EXCLUDE_IDS
+from config import START_YEAR, START_WEEK, TOTAL_WEEKS, TOTAL_KMS, ENGINE
 
 # Import local utility functions
-from utils import weeks_since, get_all_dynamodb_items
-from data_processing import process_ranking, process_activities, process_best_efforts
-from visualisation.plotting import create_progress_chart
+from utils import weeks_since
+from data_loading import build_tables, build_progress
+from data_processing.tables import column_sum, unique_values, filter_equal, select_columns
+from visualisation.plotting import create_progress_chart, create_athlete_progress_chart
 from visualisation.css import add_custom_css
 
-aws_access_key_id = st.secrets["aws_access_key_id"]
-aws_secret_access_key = st.secrets["aws_secret_access_key"]
-
 def main():
-    # Initialize a session with AWS credentials
-    session = boto3.Session(
-        aws_access_key_id=aws_access_key_id,
-        aws_secret_access_key=aws_secret_access_key,
-        region_name='eu-central-1'
-    )
-
-    dynamodb = session.resource('dynamodb')
-
-    # Retrieve data from DynamoDB tables
-    table = dynamodb.Table('athlete_credentials') 
-    athlete_data = get_all_dynamodb_items(table)
+    # Retrieve and process the data, served from the cache when it has been warmed up
+    ranking_df, activity_df, best_efforts_df = build_tables(ENGINE)
 
-    table = dynamodb.Table('activities') 
-    activity_data = get_all_dynamodb_items(table)
-
-    # Process data for ranking and activities
-    ranking_df = process_ranking(athlete_data, activity_data, EXCLUDE_IDS)
-    activity_df = process_activities(athlete_data, activity_data, EXCLUDE_IDS)
-    best_efforts_df = process_best_efforts(athlete_data, activity_data, EXCLUDE_IDS)
-
-    total_kms_execute = sum(ranking_df['KM'])
+    total_kms_execute = column_sum(ranking_df, 'KM')
     weeks_count = weeks_since(START_YEAR, START_WEEK)
 
     bar_data = {
@@ -100,7 +73,7 @@ def main():
     })
 
     # Selectbox for 'Afstand' with default value '5km'
-    afstand_options = ['All'] + list(best_efforts_df['Segment'].unique())
+    afstand_options = ['All'] + unique_values(best_efforts_df, 'Segment')
 
     selected_afstand = st.selectbox(
         "Afstand:",
@@ -110,7 +83,7 @@ def main():
     )
 
     # Selectbox for 'Atleet' with default 'All'
-    atleet_options = ['All'] + list(best_efforts_df['Atleet'].unique())
+    atleet_options = ['All'] + unique_values(best_efforts_df, 'Atleet')
 
     selected_atleet = st.selectbox(
         "Atleet:",
@@ -119,38 +92,38 @@ def main():
         key='atleet'
     )
     
-    # Apply filters based on selected 'Afstand' and 'Atleet'
-    if selected_afstand == 'All' and selected_atleet == 'All':
-        # No filtering applied (all data)
-        filtered_df = best_efforts_df
-    elif selected_afstand == 'All':
-        # Filter only by Atleet if Afstand is 'All'
-        filtered_df = best_efforts_df[best_efforts_df['Atleet'] == selected_atleet]
-    elif selected_atleet == 'All':
-        # Filter only by Afstand if Atleet is 'All'
-        filtered_df = best_efforts_df[best_efforts_df['Segment'] == selected_afstand]
-    else:
-        # Filter by both Afstand and Atleet
-        filtered_df = best_efforts_df[
-            (best_efforts_df['Segment'] == selected_afstand) &
-            (best_efforts_df['Atleet'] == selected_atleet)
-        ]
-
-    filtered_df = filtered_df[["Profile_pic", "Atleet", "Segment", "Tijd", "Tempo", "Activiteit", "Datum"]]
-    filtered_df = filtered_df.rename(columns={'Segment': 'Afstand'})
-    filtered_df.reset_index(drop=True, inplace=True)
-    filtered_df.index += 1
+    # Apply filters based on selected 'Afstand' and 'Atleet', 'All' means no filtering
+    filtered_df = best_efforts_df
+    if selected_afstand != 'All':
+        filtered_df = filter_equal(filtered_df, 'Segment', selected_afstand)
+    if selected_atleet != 'All':
+        filtered_df = filter_equal(filtered_df, 'Atleet', selected_atleet)
+
+    filtered_df = select_columns(
+        filtered_df,
+        ["Profile_pic", "Atleet", "Segment", "Tijd", "Tempo", "Activiteit", "Datum"],
+        rename={'Segment': 'Afstand'}
+    )
     
     # Display filtered DataFrame
     st.write("Best efforts")
-    st.dataframe(filtered_df, use_container_width=True, column_config={
+    st.dataframe(filtered_df, use_container_width=True, hide_index=True, column_config={
         "Profile_pic": st.column_config.ImageColumn(""),
         "Datum": st.column_config.DatetimeColumn("Datum", format='DD-MM-YYYY HH:MM'),
     })
 
     # Generate and display the progress chart
-    line_chart = create_progress_chart(activity_df, weeks_count, TOTAL_WEEKS, TOTAL_KMS, START_YEAR, START_WEEK)
-    st.altair_chart(line_chart, use_container_width=True)
+    weekly_km, athlete_progress = build_progress(ENGINE)
+    line_chart = create_progress_chart(weekly_km, weeks_count, TOTAL_WEEKS, TOTAL_KMS)
+    st.vega_lite_chart(line_chart, use_container_width=True)
+
+    # Generate and display the progress chart per athlete
+    with st.expander("Voortgang per atleet"):
+        athlete_chart, hidden_athletes = create_athlete_progress_chart(athlete_progress, weeks_count, TOTAL_WEEKS)
+        st.vega_lite_chart(athlete_chart)
+
+        if hidden_athletes > 0:
+            st.caption(f"{hidden_athletes} atleten met de minste kilometers worden niet getoond.")
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -0,0 +1,111 @@
+# tests/test_engines.py
+#
+# Checks that the pandas and the Arrow engine produce the same tables:
+#
+#   $ python -m pytest tests
+
+import json
+import unittest
+
+import pandas as pd
+
+from benchmarks.bench_processing import generate_data
+from data_processing import process_ranking, process_activities, process_best_efforts
+
+EXCLUDED_ID = 101
+NO_RUNS_ID = 102
+EDGE_ID = 103
+
+def _athlete(athlete_id, firstname):
+    return {
+        'athlete_id': athlete_id,
+        'data': json.dumps({'firstname': firstname, 'lastname': 'Rand', 'profile': f'https://example.com/{athlete_id}.jpg'}),
+    }
+
+def _activity(athlete_id, distance, elapsed_time, start_date, activity_type='Run', best_efforts=()):
+    return {
+        'data': json.dumps({
+            'athlete': {'id': athlete_id},
+            'type': activity_type,
+            'name': 'Randgeval',
+            'distance': distance,
+            'elapsed_time': elapsed_time,
+            'start_date_local': start_date,
+            'best_efforts': list(best_efforts),
+        }),
+    }
+
+def _effort(name, distance, elapsed_time):
+    return {'name': name, 'distance': distance, 'elapsed_time': elapsed_time, 'start_date_local': '2024-11-02T08:00:00Z'}
+
+def _edge_data():
+    athlete_data = [
+        _athlete(EXCLUDED_ID, 'Uitgesloten'),
+        _athlete(NO_RUNS_ID, 'Fietser'),
+        _athlete(EDGE_ID, 'Halfweg'),
+    ]
+    activity_data = [
+        # Distances exactly halfway between two rounded kilometers
+        _activity(EDGE_ID, 1050, 400, '2024-11-02T08:00:00Z'),
+        _activity(EDGE_ID, 4450, 1600, '2024-11-03T08:00:00Z'),
+        _activity(EDGE_ID, 150, 60, '2024-11-04T08:00:00Z'),
+        # Two activities with the same start date and tied best efforts
+        _activity(EDGE_ID, 5000, 1500, '2024-11-05T08:00:00Z', best_efforts=[_effort('1K', 1000, 280)]),
+        _activity(EDGE_ID, 5000, 1500, '2024-11-05T08:00:00Z', best_efforts=[_effort('1K', 1000, 280)]),
+        # Athletes that should not show up with runs
+        _activity(NO_RUNS_ID, 30000, 3600, '2024-11-02T09:00:00Z', activity_type='Ride'),
+        _activity(EXCLUDED_ID, 10000, 3000, '2024-11-02T10:00:00Z', best_efforts=[_effort('5K', 5000, 1000)]),
+    ]
+
+    return athlete_data, activity_data
+
+class TestEngines(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        athlete_data, activity_data = generate_data(20, 500)
+        edge_athletes, edge_activities = _edge_data()
+
+        cls.athlete_data = athlete_data + edge_athletes
+        cls.activity_data = activity_data + edge_activities
+        cls.exclude_ids = [EXCLUDED_ID]
+
+    def _process(self, processor):
+        pandas_df = processor(self.athlete_data, self.activity_data, self.exclude_ids, engine='pandas')
+        arrow_df = processor(self.athlete_data, self.activity_data, self.exclude_ids, engine='arrow').to_pandas()
+
+        return pandas_df.reset_index(drop=True), arrow_df
+
+    def test_ranking(self):
+        pandas_df, arrow_df = self._process(process_ranking)
+
+        # The engines store the dates with a different resolution
+        for df in (pandas_df, arrow_df):
+            df['Laatste activiteit'] = df['Laatste activiteit'].astype('datetime64[s]')
+
+        pd.testing.assert_frame_equal(pandas_df, arrow_df, check_dtype=False)
+        self.assertNotIn('Uitgesloten R', pandas_df['Atleet'].values)
+        self.assertEqual(pandas_df.loc[pandas_df['Atleet'] == 'Fietser R', 'KM'].item(), 0)
+        self.assertEqual(pandas_df.loc[pandas_df['Atleet'] == 'Halfweg R', 'KM'].item(), 15.7)
+
+    def test_activities(self):
+        pandas_df, arrow_df = self._process(process_activities)
+
+        pd.testing.assert_frame_equal(pandas_df, arrow_df, check_dtype=False)
+        halfway = pandas_df.loc[pandas_df['Activiteit'] == 'Randgeval', 'KM'].tolist()
+        self.assertEqual(halfway, [5.0, 5.0, 0.1, 4.5, 1.1])
+
+    def test_best_efforts(self):
+        pandas_df, arrow_df = self._process(process_best_efforts)
+
+        # The order of efforts with the same time differs between the engines
+        key = ['Atleet', 'Segment', 'Sort_Time']
+        pd.testing.assert_frame_equal(
+            pandas_df.sort_values(key).reset_index(drop=True)[key],
+            arrow_df.sort_values(key).reset_index(drop=True)[key],
+            check_dtype=False,
+        )
+        self.assertNotIn('Uitgesloten R', pandas_df['Atleet'].values)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,118 @@
+# tests/test_image_utils.py
+#
+# Checks the thumbnail cache against a local HTTP server standing in for the CDN:
+#
+#   $ python -m pytest tests
+
+import base64
+import json
+import os
+import tempfile
+import threading
+import time
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from utils.image_utils import STALE_TMP_AGE, STATIC_URL, _evict, get_profile_thumbnails
+
+# A 1x1 pixel PNG
+PICTURE = base64.b64decode(
+    'iVBORw0KGgoAAAANSUhEUgAAAAEAAAABCAYAAAAfFcSJAAAADUlEQVR42mP8z8BQDwAEhQGAhKmMIQAAAABJRU5ErkJggg=='
+)
+
+class _PictureHandler(BaseHTTPRequestHandler):
+    requests = []  # Paths of all requests
+    failures = {}  # Number of times each path responds with 503 before it recovers
+
+    def do_GET(self):
+        self.requests.append(self.path)
+
+        if self.failures.get(self.path, 0) > 0:
+            self.failures[self.path] -= 1
+            self.send_response(503)
+            self.end_headers()
+            return
+
+        self.send_response(200)
+        self.send_header('Content-Type', 'image/png')
+        self.send_header('Content-Length', str(len(PICTURE)))
+        self.end_headers()
+        self.wfile.write(PICTURE)
+
+    def log_message(self, format, *args):
+        pass
+
+class TestProfileThumbnails(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.server = ThreadingHTTPServer(('127.0.0.1', 0), _PictureHandler)
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self):
+        _PictureHandler.requests = []
+        _PictureHandler.failures = {}
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.cache_dir = tmp.name
+
+    def _athlete(self, athlete_id, path):
+        url = f'http://127.0.0.1:{self.server.server_port}{path}'
+        return url, {'athlete_id': athlete_id, 'data': json.dumps({'profile': url})}
+
+    def test_downloads_each_picture_once(self):
+        url, athlete = self._athlete(1, '/a.jpg')
+
+        first = get_profile_thumbnails([athlete], cache_dir=self.cache_dir)
+        second = get_profile_thumbnails([athlete], cache_dir=self.cache_dir)
+
+        self.assertEqual(first, second)
+        self.assertTrue(first[url].startswith(f'{STATIC_URL}/1_'))
+        self.assertTrue(os.path.exists(os.path.join(self.cache_dir, os.path.basename(first[url]))))
+        self.assertEqual(_PictureHandler.requests, ['/a.jpg'])
+
+    def test_retries_failed_download(self):
+        url, athlete = self._athlete(2, '/b.jpg')
+        _PictureHandler.failures['/b.jpg'] = 1
+
+        self.assertEqual(get_profile_thumbnails([athlete], cache_dir=self.cache_dir)[url], url)
+        self.assertTrue(get_profile_thumbnails([athlete], cache_dir=self.cache_dir)[url].startswith(STATIC_URL))
+        self.assertEqual(_PictureHandler.requests, ['/b.jpg', '/b.jpg'])
+
+    def test_inline_thumbnail(self):
+        url, athlete = self._athlete(3, '/c.jpg')
+
+        thumbnails = get_profile_thumbnails([athlete], inline=True, cache_dir=self.cache_dir)
+
+        self.assertTrue(thumbnails[url].startswith('data:image/jpeg;base64,'))
+
+    def _touch(self, name, age):
+        path = os.path.join(self.cache_dir, name)
+        open(path, 'wb').close()
+        os.utime(path, (time.time() - age, time.time() - age))
+        return name
+
+    def test_evict_keeps_thumbnails_in_use(self):
+        in_use = {self._touch(f'{athlete_id}_old.jpg', 100 + athlete_id) for athlete_id in range(3)}
+        self._touch('9_unused.jpg', 200)
+
+        _evict(self.cache_dir, in_use=in_use, max_files=1)
+
+        self.assertEqual(set(os.listdir(self.cache_dir)), in_use)
+
+    def test_evict_removes_stale_temporary_files(self):
+        stale = self._touch('stale.tmp', STALE_TMP_AGE + 60)
+        fresh = self._touch('fresh.tmp', 0)
+
+        _evict(self.cache_dir)
+
+        self.assertNotIn(stale, os.listdir(self.cache_dir))
+        self.assertIn(fresh, os.listdir(self.cache_dir))
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,67 @@
+# tests/test_progress.py
+#
+# Checks the weekly aggregation behind the progress charts:
+#
+#   $ python -m pytest tests
+
+import unittest
+
+import pandas as pd
+
+from data_processing import process_weekly_progress, process_athlete_progress
+
+START_YEAR = 2024
+START_WEEK = 42
+TOTAL_WEEKS = 26
+
+def _activities(rows):
+    return pd.DataFrame(rows, columns=['Atleet', 'Datum', 'KM'])
+
+class TestWeeklyProgress(unittest.TestCase):
+
+    def setUp(self):
+        self.activity_df = _activities([
+            ('Anna', '2024-10-14T08:00:00Z', 10.0),  # ISO week 42 of 2024, week 0
+            ('Anna', '2024-10-30T08:00:00Z', 5.0),   # ISO week 44 of 2024, week 2
+            ('Bert', '2025-01-01T08:00:00Z', 7.5),   # ISO week 1 of 2025, week 11
+            ('Bert', '2024-12-30T08:00:00Z', 2.5),   # ISO week 1 of 2025 starts in 2024
+            ('Bert', '2024-10-13T08:00:00Z', 100.0), # ISO week 41 of 2024, before START_WEEK
+            ('Anna', '2023-12-01T08:00:00Z', 100.0), # Before START_YEAR
+        ])
+
+    def test_weekly_progress(self):
+        weekly_km = process_weekly_progress(self.activity_df, START_YEAR, START_WEEK, TOTAL_WEEKS)
+
+        self.assertEqual(list(weekly_km.columns), ['Weeks_Since_Start', 'KM', 'Cumulative_KM'])
+        self.assertEqual(weekly_km['Weeks_Since_Start'].tolist(), list(range(TOTAL_WEEKS + 1)))
+
+        km = dict(zip(weekly_km['Weeks_Since_Start'], weekly_km['KM']))
+        self.assertEqual(km[0], 10.0)
+        self.assertEqual(km[2], 5.0)
+        self.assertEqual(km[11], 10.0)
+        self.assertEqual(sum(km.values()), 25.0)
+
+        # Weeks without activities are filled with zeros
+        self.assertEqual(km[1], 0)
+        self.assertEqual(km[TOTAL_WEEKS], 0)
+        self.assertEqual(weekly_km['Cumulative_KM'].iloc[-1], 25.0)
+
+    def test_athlete_progress(self):
+        athlete_progress = process_athlete_progress(self.activity_df, START_YEAR, START_WEEK, TOTAL_WEEKS)
+
+        self.assertEqual(list(athlete_progress.columns), ['Atleet', 'Weeks_Since_Start', 'KM', 'Cumulative_KM'])
+        self.assertEqual(len(athlete_progress), 2 * (TOTAL_WEEKS + 1))
+
+        # Anna ran more kilometers in the challenge, the runs before the start don't count
+        self.assertEqual(list(athlete_progress['Atleet'].unique()), ['Anna', 'Bert'])
+
+        totals = athlete_progress.groupby('Atleet')['Cumulative_KM'].last()
+        self.assertEqual(totals['Anna'], 15.0)
+        self.assertEqual(totals['Bert'], 10.0)
+
+        bert = athlete_progress[athlete_progress['Atleet'] == 'Bert'].set_index('Weeks_Since_Start')
+        self.assertEqual(bert.loc[10, 'Cumulative_KM'], 0)
+        self.assertEqual(bert.loc[11, 'KM'], 10.0)
+
+if __name__ == "__main__":
+    unittest.main()
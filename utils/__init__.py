@@ -1,6 +1,7 @@
 # utils/__init__.py
 
 from .time_utils import weeks_since
-from .dynamodb_utils import get_all_dynamodb_items
+from .dynamodb_utils import get_dynamodb_resource, get_all_dynamodb_items
+from .image_utils import get_profile_thumbnails
 
-__all__ = ['weeks_since', 'get_all_dynamodb_items']
\ No newline at end of file
+__all__ = ['weeks_since', 'get_dynamodb_resource', 'get_all_dynamodb_items', 'get_profile_thumbnails']
\ No newline at end of file
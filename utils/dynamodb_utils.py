@@ -1,6 +1,28 @@
 # utils/dynamodb_utils.py
 
-from botocore.exceptions import ClientError
+def get_dynamodb_resource(aws_access_key_id, aws_secret_access_key, region_name):
+    """
+    Create a DynamoDB resource from AWS credentials.
+
+    boto3 is slow to import, so it is only imported when the first resource is created.
+
+    Parameters:
+    aws_access_key_id (str): The AWS access key id.
+    aws_secret_access_key (str): The AWS secret access key.
+    region_name (str): The AWS region of the DynamoDB tables.
+
+    Returns:
+    boto3.resources.factory.dynamodb.ServiceResource: The DynamoDB resource.
+    """
+    import boto3
+
+    session = boto3.Session(
+        aws_access_key_id=aws_access_key_id,
+        aws_secret_access_key=aws_secret_access_key,
+        region_name=region_name
+    )
+
+    return session.resource('dynamodb')
 
 def get_all_dynamodb_items(table):
     """
@@ -23,6 +45,8 @@ def get_all_dynamodb_items(table):
     error message is printed.
     """
 
+    from botocore.exceptions import ClientError
+
     items = []
     try:
         response = table.scan()
@@ -35,5 +59,6 @@ def get_all_dynamodb_items(table):
 
     except ClientError as e:
         print(f"Failed to get items from DynamoDB: {e.response['Error']['Message']}")
+        raise
 
     return items
\ No newline at end of file
@@ -0,0 +1,191 @@
+# utils/image_utils.py
+
+import base64
+import hashlib
+import io
+import json
+import os
+import tempfile
+import time
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+
+ATHLETE_ID = 'athlete_id'
+ATHLETE_DATA = 'data'
+PROFILE_PIC = 'profile'
+
+APP_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+CACHE_DIR = os.path.join(APP_DIR, 'static', 'thumbnails') # Served by Streamlit static serving
+STATIC_URL = 'app/static/thumbnails' # URL of CACHE_DIR
+THUMBNAIL_SIZE = 64 # Width and height of a thumbnail in pixels
+MAX_CACHED_FILES = 500 # Oldest thumbnails not in use are evicted beyond this number
+DOWNLOAD_TIMEOUT = 5 # Seconds
+STALE_TMP_AGE = DOWNLOAD_TIMEOUT * 4 # Seconds before a leftover temporary file is removed
+DOWNLOAD_WORKERS = 8
+
+def _cache_key(athlete_id, url):
+    """
+    Build the file name of a thumbnail from the athlete id and the picture URL.
+
+    A new profile picture gets a new URL, so an outdated thumbnail is never served.
+    """
+    digest = hashlib.sha256(f"{athlete_id}:{url}".encode()).hexdigest()[:16]
+
+    return f"{athlete_id}_{digest}.jpg"
+
+def _make_thumbnail(content, size=THUMBNAIL_SIZE):
+    """
+    Downsize an image to a square JPEG thumbnail.
+
+    Parameters:
+    content (bytes): The original image.
+    size (int): The width and height of the thumbnail in pixels.
+
+    Returns:
+    bytes: The thumbnail, or the original image if Pillow is not installed.
+    """
+    try:
+        from PIL import Image
+    except ImportError:  # Pillow is optional, pictures are then cached at their original size
+        return content
+
+    with Image.open(io.BytesIO(content)) as image:
+        image = image.convert('RGB')
+        image.thumbnail((size, size))
+        buffer = io.BytesIO()
+        image.save(buffer, format='JPEG', quality=85)
+
+    return buffer.getvalue()
+
+def _mtime(path):
+    """
+    Return the modification time of a file, or 0 when it was removed in the meantime.
+    """
+    try:
+        return os.path.getmtime(path)
+    except OSError:
+        return 0
+
+def _evict(cache_dir, in_use=(), max_files=MAX_CACHED_FILES):
+    """
+    Remove the least recently used thumbnails when the cache holds more than max_files,
+    and temporary files left behind by interrupted downloads.
+
+    Parameters:
+    cache_dir (str): The directory in which the thumbnails are stored.
+    in_use (set of str): File names of thumbnails that are in use and are never removed.
+    max_files (int): The number of thumbnails to keep.
+    """
+    names = os.listdir(cache_dir)
+    now = time.time()
+
+    # Temporary files of downloads in progress are left alone until they are stale
+    stale = [
+        name for name in names
+        if name.endswith('.tmp') and now - _mtime(os.path.join(cache_dir, name)) > STALE_TMP_AGE
+    ]
+
+    paths = [os.path.join(cache_dir, name) for name in names if name.endswith('.jpg')]
+    paths.sort(key=_mtime, reverse=True)
+    evicted = [path for path in paths[max_files:] if os.path.basename(path) not in in_use]
+
+    for path in evicted + [os.path.join(cache_dir, name) for name in stale]:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+def _thumbnail_path(athlete_id, url, cache_dir=CACHE_DIR):
+    """
+    Return the path of the cached thumbnail, downloading the picture if it is not cached.
+
+    Only successful downloads end up in the cache, so a failed download is retried
+    on the next call.
+    """
+    path = os.path.join(cache_dir, _cache_key(athlete_id, url))
+
+    if os.path.exists(path):
+        os.utime(path)  # Mark as recently used
+        return path
+
+    with urllib.request.urlopen(url, timeout=DOWNLOAD_TIMEOUT) as response:
+        content = response.read()
+
+    os.makedirs(cache_dir, exist_ok=True)
+
+    # Write to a unique temporary file first so a concurrent reader never sees a partial
+    # image and concurrent writers of the same picture don't write to the same file
+    fd, tmp_path = tempfile.mkstemp(dir=cache_dir, suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(_make_thumbnail(content))
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.remove(tmp_path)
+        raise
+
+    return path
+
+def get_thumbnail(athlete_id, url, inline=False, cache_dir=CACHE_DIR):
+    """
+    Get a small, locally cached version of an athlete's profile picture.
+
+    The picture is downloaded once per athlete id and URL and stored as a thumbnail
+    in cache_dir. Every use marks the thumbnail as recently used for the eviction.
+
+    Parameters:
+    athlete_id (int): The id of the athlete.
+    url (str): The URL of the profile picture.
+    inline (bool): Return the thumbnail as a data URL instead of its URL under STATIC_URL,
+                   for when Streamlit static serving is disabled.
+    cache_dir (str): The directory in which the thumbnails are stored.
+
+    Returns:
+    str: The URL of the thumbnail, or the original URL if the download failed.
+    """
+    if not url or not url.startswith(('http://', 'https://')):
+        return url
+
+    try:
+        path = _thumbnail_path(athlete_id, url, cache_dir)
+    except (OSError, ValueError) as e:
+        print(f"Failed to cache profile picture of athlete {athlete_id}: {e}")
+        return url
+
+    if not inline:
+        return f"{STATIC_URL}/{os.path.basename(path)}"
+
+    with open(path, 'rb') as f:
+        encoded = base64.b64encode(f.read()).decode()
+
+    return f"data:image/jpeg;base64,{encoded}"
+
+def get_profile_thumbnails(athlete_data, inline=False, cache_dir=CACHE_DIR):
+    """
+    Get thumbnails of the profile pictures of all athletes.
+
+    Parameters:
+    athlete_data (list of dict): A list of dictionaries containing athlete information.
+                                  Each dictionary should include 'athlete_id' and 'data'
+                                  (which contains the athlete's profile picture).
+    inline (bool): Return the thumbnails as data URLs instead of static URLs.
+    cache_dir (str): The directory in which the thumbnails are stored.
+
+    Returns:
+    dict: A dictionary mapping each original profile picture URL to its thumbnail URL.
+    """
+    pictures = {
+        json.loads(athlete.get(ATHLETE_DATA)).get(PROFILE_PIC): athlete.get(ATHLETE_ID)
+        for athlete in athlete_data
+    }
+
+    with ThreadPoolExecutor(max_workers=DOWNLOAD_WORKERS) as executor:
+        thumbnails = dict(zip(
+            pictures,
+            executor.map(lambda url: get_thumbnail(pictures[url], url, inline, cache_dir), pictures)
+        ))
+
+    if os.path.isdir(cache_dir):
+        _evict(cache_dir, in_use={_cache_key(athlete_id, url) for url, athlete_id in pictures.items()})
+
+    return thumbnails
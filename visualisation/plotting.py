@@ -1,70 +1,66 @@
-import altair as alt
+import hashlib
+
 import pandas as pd
+import streamlit as st
+
+MAX_CHART_ROWS = 2000 # Hard cap on the number of rows embedded in a single chart spec
+SPEC_CACHE_ENTRIES = 16 # Number of chart specs kept in the cache
+ATHLETE_CHART_COLUMNS = 4 # Number of small multiples per row
 
-def create_progress_chart(activity_df, weeks_count, TOTAL_WEEKS, TOTAL_KMS, START_YEAR, START_WEEK):
+def _data_hash(df):
     """
-    Create an Altair line chart to visualize the progress of the running challenge.
+    Calculate a content hash of a DataFrame, used as the cache key of a chart spec.
 
     Parameters:
-    activity_df (pd.DataFrame): A DataFrame containing the activity data.
-    weeks_count (int): The current week count.
-    TOTAL_WEEKS (int): The total number of weeks in the challenge.
-    TOTAL_KMS (int): The total number of kilometers in the challenge.
-    START_YEAR (int): The starting year of the challenge.
-    START_WEEK (int): The starting week of the challenge.
+    df (pd.DataFrame): The DataFrame to hash.
 
     Returns:
-    alt.Chart: An Altair line chart showing the progress of the challenge.
+    str: A hex digest of the column names and the values of the DataFrame.
     """
+    digest = hashlib.sha256(','.join(map(str, df.columns)).encode())
+    digest.update(pd.util.hash_pandas_object(df, index=False).values.tobytes())
 
-    # Process cumulative distances per week
-    activity_df['Datum'] = pd.to_datetime(activity_df['Datum'])
-    activity_df['Week_Number'] = activity_df['Datum'].dt.isocalendar().week
-    activity_df['Year'] = activity_df['Datum'].dt.isocalendar().year
-    activity_df = activity_df[activity_df['Year'] >= START_YEAR]
+    return digest.hexdigest()
 
-    def calculate_weeks_since(row):
-        activity_year = row['Year']
-        activity_week = row['Week_Number']
-        weeks_since_start = (activity_year - START_YEAR) * 52 + (activity_week - START_WEEK)
-        if activity_year == START_YEAR:
-            weeks_since_start = activity_week - START_WEEK
-        return weeks_since_start  # Week count starts from 0
-
-    activity_df['Weeks_Since_Start'] = activity_df.apply(calculate_weeks_since, axis=1)
-
-    # Group by week and sum distances
-    weekly_km = activity_df.groupby('Weeks_Since_Start')['KM'].sum().reset_index()
+def _cap_rows(plot_data, max_rows=MAX_CHART_ROWS):
+    """
+    Limit the number of rows of the plot data so the embedded spec stays small.
 
-    # Ensure all weeks are represented up to TOTAL_WEEKS
-    weeks = pd.DataFrame({'Weeks_Since_Start': range(0, TOTAL_WEEKS + 1)})
+    Parameters:
+    plot_data (pd.DataFrame): The data that will be embedded in the chart spec.
+    max_rows (int): The maximum number of rows to keep.
 
-    # Merge to include all weeks
-    weekly_km = weeks.merge(weekly_km, on='Weeks_Since_Start', how='left')
+    Returns:
+    pd.DataFrame: The first max_rows rows of the plot data.
+    """
+    return plot_data.head(max_rows)
 
-    # Fill missing values with zero
-    weekly_km['KM'] = weekly_km['KM'].fillna(0)
+@st.cache_data(max_entries=SPEC_CACHE_ENTRIES)
+def _progress_spec(data_hash, _weekly_km, weeks_count, TOTAL_WEEKS, TOTAL_KMS):
+    import altair as alt  # Only needed when the spec is not cached
 
-    # Compute cumulative sum
-    weekly_km['Cumulative_KM'] = weekly_km['KM'].cumsum()
+    # _weekly_km is not hashed by Streamlit, data_hash is the cache key for it
+    weekly_km = _weekly_km
 
     # Limit actual progress to current week
     weekly_km_actual = weekly_km[weekly_km['Weeks_Since_Start'] <= weeks_count]
 
-    # Create goal line data
-    weekly_km['Goal_KM'] = (weekly_km['Weeks_Since_Start'] / TOTAL_WEEKS) * TOTAL_KMS
-
     # Prepare data for plotting
     plot_data_actual = weekly_km_actual[['Weeks_Since_Start', 'Cumulative_KM']].copy()
     plot_data_actual['Type'] = 'Werkelijke KMs'
     plot_data_actual.rename(columns={'Cumulative_KM': 'Kilometers'}, inplace=True)
 
-    plot_data_goal = weekly_km[['Weeks_Since_Start', 'Goal_KM']].copy()
+    # Create goal line data
+    plot_data_goal = weekly_km[['Weeks_Since_Start']].copy()
+    plot_data_goal['Kilometers'] = (plot_data_goal['Weeks_Since_Start'] / TOTAL_WEEKS) * TOTAL_KMS
     plot_data_goal['Type'] = 'Doel KMs'
-    plot_data_goal.rename(columns={'Goal_KM': 'Kilometers'}, inplace=True)
 
-    # Combine the data
-    plot_data = pd.concat([plot_data_actual, plot_data_goal], ignore_index=True)
+    # Combine the data, capping each line separately so the goal line is never cut off
+    plot_data = pd.concat([
+        _cap_rows(plot_data_actual, MAX_CHART_ROWS // 2),
+        _cap_rows(plot_data_goal, MAX_CHART_ROWS // 2),
+    ], ignore_index=True)
+    plot_data['Kilometers'] = plot_data['Kilometers'].astype(float).round(1)
 
     # Define color scale
     color_scale = alt.Scale(
@@ -96,4 +92,78 @@ def create_progress_chart(activity_df, weeks_count, TOTAL_WEEKS, TOTAL_KMS, STAR
         title='Voortgang'
     )
 
-    return line_chart
\ No newline at end of file
+    return line_chart.to_dict()
+
+@st.cache_data(max_entries=SPEC_CACHE_ENTRIES)
+def _athlete_progress_spec(data_hash, _athlete_progress, weeks_count, TOTAL_WEEKS, columns):
+    import altair as alt  # Only needed when the spec is not cached
+
+    # _athlete_progress is not hashed by Streamlit, data_hash is the cache key for it
+    athlete_progress = _athlete_progress
+
+    # Only embed the actual progress up to the current week
+    plot_data = athlete_progress.loc[
+        athlete_progress['Weeks_Since_Start'] <= weeks_count,
+        ['Atleet', 'Weeks_Since_Start', 'Cumulative_KM']
+    ].rename(columns={'Cumulative_KM': 'Kilometers'})
+    plot_data['Kilometers'] = plot_data['Kilometers'].astype(float).round(1)
+
+    # Drop whole athletes rather than cutting a line short when over the row cap
+    all_athletes = list(plot_data['Atleet'].unique())
+    rows_per_athlete = max(len(plot_data) // max(len(all_athletes), 1), 1)
+    athletes = all_athletes[:MAX_CHART_ROWS // rows_per_athlete]
+    plot_data = _cap_rows(plot_data[plot_data['Atleet'].isin(athletes)])
+
+    line_chart = alt.Chart(plot_data).mark_line().encode(
+        x=alt.X('Weeks_Since_Start:Q', title='', scale=alt.Scale(domain=[0, TOTAL_WEEKS])),
+        y=alt.Y('Kilometers:Q', title=''),
+    ).properties(
+        width=120,
+        height=80
+    ).facet(
+        facet=alt.Facet('Atleet:N', sort=athletes, title=None),
+        columns=columns
+    ).properties(
+        title='Voortgang per atleet'
+    )
+
+    return line_chart.to_dict(), len(all_athletes) - len(athletes)
+
+def create_progress_chart(weekly_km, weeks_count, TOTAL_WEEKS, TOTAL_KMS):
+    """
+    Create a Vega-Lite line chart spec to visualize the progress of the running challenge.
+
+    The spec is cached on a hash of the weekly data, so it is only rebuilt when the
+    data changes.
+
+    Parameters:
+    weekly_km (pd.DataFrame): The weekly progress as returned by process_weekly_progress.
+    weeks_count (int): The current week count.
+    TOTAL_WEEKS (int): The total number of weeks in the challenge.
+    TOTAL_KMS (int): The total number of kilometers in the challenge.
+
+    Returns:
+    dict: A Vega-Lite spec of a line chart showing the progress of the challenge.
+    """
+    return _progress_spec(_data_hash(weekly_km), weekly_km, weeks_count, TOTAL_WEEKS, TOTAL_KMS)
+
+def create_athlete_progress_chart(athlete_progress, weeks_count, TOTAL_WEEKS, columns=ATHLETE_CHART_COLUMNS):
+    """
+    Create a Vega-Lite spec with a small line chart of the cumulative kilometers per athlete.
+
+    The spec is cached on a hash of the progress data. Athletes beyond the row cap
+    are left out, starting with the athletes with the fewest kilometers, and counted
+    so the caller can show that the chart is incomplete.
+
+    Parameters:
+    athlete_progress (pd.DataFrame): The progress per athlete as returned by
+                                     process_athlete_progress.
+    weeks_count (int): The current week count.
+    TOTAL_WEEKS (int): The total number of weeks in the challenge.
+    columns (int): The number of charts per row.
+
+    Returns:
+    tuple: A Vega-Lite spec of the faceted line charts and the number of athletes
+           left out of it.
+    """
+    return _athlete_progress_spec(_data_hash(athlete_progress), athlete_progress, weeks_count, TOTAL_WEEKS, columns)